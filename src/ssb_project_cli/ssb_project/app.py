@@ -4,21 +4,14 @@ import typing as t
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from typing_extensions import Annotated
 
-from ssb_project_cli.ssb_project.util import set_debug_logging
-
-from .build.build import build_project
-from .clean.clean import clean_project
-from .create.create import create_project
 from .create.repo_privacy import RepoPrivacy
 from .settings import CURRENT_WORKING_DIRECTORY
 from .settings import GITHUB_ORG_NAME
 from .settings import HOME_PATH
 from .settings import STAT_TEMPLATE_DEFAULT_REFERENCE
 from .settings import STAT_TEMPLATE_REPO_URL
-from .util import handle_no_kernel_argument
 
 
 # Don't print with color, it's difficult to read when run in Jupyter
@@ -40,8 +33,6 @@ typer.rich_utils.STYLE_OPTION_ENVVAR = "dim"
 typer.rich_utils.STYLE_REQUIRED_SHORT = ""
 typer.rich_utils.STYLE_REQUIRED_LONG = ""
 typer.rich_utils.STYLE_OPTIONS_PANEL_BORDER = "dim"
-console = Console(color_system=None)
-print = console.print
 
 app = typer.Typer(
     help="Usage instructions: https://manual.dapla.ssb.no/ssbproject.html",
@@ -99,6 +90,11 @@ def create(  # noqa: C901, S107
     ] = False,
 ) -> None:
     """:sparkles:  Create a project locally, and optionally on GitHub with the flag --github. The project will follow SSB's best practice for development."""
+    # Command modules are imported here so GitPython, PyGithub and friends
+    # are only loaded for the command that needs them
+    from .create.create import create_project
+    from .util import handle_no_kernel_argument
+
     if not checkout and template_git_url is STAT_TEMPLATE_REPO_URL:
         checkout = STAT_TEMPLATE_DEFAULT_REFERENCE
 
@@ -141,6 +137,9 @@ def build(
     ] = False,
 ) -> None:
     """:wrench:  Create a virtual environment and corresponding Jupyter kernel. Runs in the current folder if no arguments are supplied."""
+    from .build.build import build_project
+    from .util import handle_no_kernel_argument
+
     build_project(
         path,
         CURRENT_WORKING_DIRECTORY,
@@ -158,11 +157,15 @@ def clean(
     )
 ) -> None:
     """:broom:  Delete the kernel for the given project name."""
+    from .clean.clean import clean_project
+
     clean_project(project_name)
 
 
 def main() -> None:
     """Main function of ssb_project_cli."""
+    from .util import set_debug_logging
+
     set_debug_logging()
     app(prog_name="ssb-project")  # pragma: no cover
 
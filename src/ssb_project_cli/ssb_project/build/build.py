@@ -24,6 +24,9 @@ from ssb_project_cli.ssb_project.util import (
 )
 
 
+PYTHON_EXECUTABLE_PATTERN = re.compile(r"^.*(?:/python3|/python|/python\.sh)$")
+
+
 def build_project(
     path: Path | None,
     working_directory: Path,
@@ -116,7 +119,7 @@ def ipykernel_attach_bashrc(project_name: str) -> None:
         )
         sys.exit(1)
 
-    project_kernel_path = kernels[project_name]["resource_dir"]
+    project_kernel_path = kernels[project_name]
     if not Path(project_kernel_path).exists():
         print(
             f":x:\tCould not mount .bashrc, path: '{project_kernel_path}' does not exist."  # noqa: B907
@@ -172,8 +175,7 @@ def _get_python_executable_path(argv: List[str]) -> str | None:
 
     Returns: Path to python executable if it exists, otherwise None
     """
-    pattern = r"^.*(?:/python3|/python|/python\.sh)$"
-    matches = [entry for entry in argv if re.match(pattern, entry)]
+    matches = [entry for entry in argv if PYTHON_EXECUTABLE_PATTERN.match(entry)]
     return matches[0] if len(matches) >= 1 else None
 
 
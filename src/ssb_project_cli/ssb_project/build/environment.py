@@ -42,11 +42,11 @@ def _local_file_contains_remote_lines(
     """
     # Read the contents of the local file into a set of lines
     with open(local_file_path) as local_file:
-        local_content = set(local_file.read().strip().split("\n"))
+        local_content = set(local_file.read().strip().splitlines())
 
     # Read the contents of the remote file into a set of lines
     with open(remote_file_path) as remote_file:
-        remote_content = set(remote_file.read().strip().split("\n"))
+        remote_content = set(remote_file.read().strip().splitlines())
     # Check if the local file has all lines in the remote file
     return remote_content.issubset(local_content)
 
@@ -1,14 +1,19 @@
 """This module contains functions used to install poetry dependecies and kernels."""
 
 import os
+from collections.abc import Callable
 from pathlib import Path
 from rich.progress import Progress
 from rich.progress import SpinnerColumn
+from rich.progress import TaskID
 from rich.progress import TextColumn
 from rich import print
+from rich.markup import escape
 
 from .environment import NEXUS_SOURCE_NAME
 from ssb_project_cli.ssb_project.util import execute_command
+from ssb_project_cli.ssb_project.util import execute_command_streaming
+from ssb_project_cli.ssb_project.util import get_kernels_dict
 from .environment import JUPYTER_IMAGE_SPEC
 from .environment import PIP_INDEX_URL
 from .environment import running_onprem
@@ -20,25 +25,47 @@ def poetry_install(project_directory: Path) -> None:
     Args:
         project_directory: Path of project
     """
+    description = "Installing dependencies... This may take a few minutes"
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
-        progress.add_task(
-            description="Installing dependencies... This may take a few minutes",
-            total=None,
-        )
+        task = progress.add_task(description=description, total=None)
 
-        execute_command(
+        execute_command_streaming(
             "poetry install".split(" "),
             "poetry-install",
             ":white_check_mark:\tInstalled dependencies in the virtual environment",
             "Error: Something went wrong when installing packages with Poetry.",
             project_directory,
+            on_output=_progress_updater(progress, task, description),
         )
 
 
+def _progress_updater(
+    progress: Progress, task: TaskID, description: str
+) -> Callable[[str], None]:
+    """Creates a callback showing the latest output line next to the task description.
+
+    Args:
+        progress: The progress display
+        task: The task to update
+        description: The base description of the task
+
+    Returns:
+        A callback for the `on_output` argument of `execute_command_streaming`.
+    """
+
+    def update(line: str) -> None:
+        if line.strip():
+            progress.update(
+                task, description=f"{description} {escape(line.strip()[:80])}"
+            )
+
+    return update
+
+
 def poetry_update_lockfile_dependencies(project_directory: Path) -> None:
     """Call poetry update --lock in project_directory.
 
@@ -47,22 +74,21 @@ def poetry_update_lockfile_dependencies(project_directory: Path) -> None:
     Args:
         project_directory: Path of project
     """
+    description = "Updating lock file dependencies... This may take some time."
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
-        progress.add_task(
-            description="Updating lock file dependencies... This may take some time.",
-            total=None,
-        )
+        task = progress.add_task(description=description, total=None)
 
-        execute_command(
+        execute_command_streaming(
             "poetry update --lock".split(" "),
             "poetry-update-lock-deps",
             ":white_check_mark:\tUpdated lock file dependencies",
             "Error: Something went wrong when updating lock file dependencies with Poetry.",
             project_directory,
+            on_output=_progress_updater(progress, task, description),
         )
 
 
@@ -178,23 +204,26 @@ def install_ipykernel(project_directory: Path, project_name: str) -> None:
         project_directory: Path of project
         project_name: Name of project
     """
+    description = "Installing Jupyter kernel..."
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
-        progress.add_task(description="Installing Jupyter kernel...", total=None)
+        task = progress.add_task(description=description, total=None)
         kernel_cmd = f"poetry run python3 -m ipykernel install --user --name {project_name}".split(
             " "
         )
 
-        execute_command(
+        execute_command_streaming(
             kernel_cmd,
             "install-ipykernel",
             f":white_check_mark:\tInstalled Jupyter Kernel ({project_name})",
             "Something went wrong while installing ipykernel.",
             project_directory,
+            on_output=_progress_updater(progress, task, description),
         )
+    get_kernels_dict.cache_clear()
 
 
 def check_and_fix_onprem_source(project_root: Path) -> None:
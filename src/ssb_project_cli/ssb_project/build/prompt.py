@@ -4,9 +4,6 @@ from pathlib import Path
 
 import typer
 from ssb_project_cli.ssb_project.build.environment import reset_global_gitconfig
-from ssb_project_cli.ssb_project.create.local_repo import (
-    reset_project_git_configuration,
-)
 
 
 def confirm_fix_ssb_git_config(
@@ -40,6 +37,12 @@ def confirm_fix_ssb_git_config(
         if not valid_global_git_config:
             reset_global_gitconfig()
         if not valid_project_git_config:
+            # Imported here so `build` does not load cruft and PyGithub
+            # through the create package unless a reset is needed
+            from ssb_project_cli.ssb_project.create.local_repo import (
+                reset_project_git_configuration,
+            )
+
             reset_project_git_configuration(
                 project_name, template_repo_url, checkout, project_directory
             )
@@ -1,12 +1,14 @@
 """Clean command module."""
 
+import shutil
 import sys
 from pathlib import Path
+from traceback import format_exc
 
 import questionary
 from rich import print
 
-from ssb_project_cli.ssb_project.util import execute_command
+from ssb_project_cli.ssb_project.util import create_error_log
 from ssb_project_cli.ssb_project.util import get_kernels_dict
 from ssb_project_cli.ssb_project.util import remove_kernel_spec
 
@@ -53,15 +55,15 @@ def clean_venv() -> None:
     ).ask()
     if confirm:
         if Path(".venv").is_dir():
-            clean_venv_cmd = "rm -rf .venv"
-
-            execute_command(
-                clean_venv_cmd,
-                "clean-virtualenv",
-                "Virtual environment successfully removed!",
-                "Something went wrong while removing virtual environment in current directory. A log of the issue was created...",
-                None,
-            )
+            try:
+                shutil.rmtree(".venv")
+            except OSError:
+                print(
+                    "Something went wrong while removing virtual environment in current directory. A log of the issue was created..."
+                )
+                create_error_log(format_exc(), "clean-virtualenv")
+                sys.exit(1)
+            print("Virtual environment successfully removed!")
 
         else:
             print("No virtual environment found in current directory. Skipping...")
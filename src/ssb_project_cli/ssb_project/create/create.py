@@ -2,6 +2,7 @@
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import rmtree
 
@@ -19,7 +20,7 @@ from .github import set_branch_protection_rules
 from .github import valid_repo_name
 from .local_repo import create_project_from_template
 from .local_repo import make_and_init_git_repo
-from .local_repo import make_git_repo_and_push
+from .local_repo import push_git_repo
 from .prompt import choose_login
 from .prompt import request_project_description
 from .repo_privacy import RepoPrivacy
@@ -72,8 +73,9 @@ def create_project(  # noqa: C901
 
         exit(1)
 
+    github_username = None
     if add_github and not github_token:
-        github_token = choose_login(home_path)
+        github_username, github_token = choose_login(home_path)
 
     if add_github and not github_token:
         print("Needs GitHub token, please specify with --github-token")
@@ -119,13 +121,23 @@ def create_project(  # noqa: C901
 
         git_repo_dir = Path(working_directory.joinpath(project_name))
         if add_github:
-            print("Creating an empty repo on Github")
-            repo_url = create_github(
-                github_token, project_name, repo_privacy, description, github_org_name
-            )
-
-            print("Creating a local repo, and pushing to Github")
-            make_git_repo_and_push(github_token, repo_url, git_repo_dir)
+            print("Creating an empty repo on Github, and a local repo")
+            # The remote repo and the local initial commit are independent,
+            # so the GitHub round-trips run while git builds the commit.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                repo_url_future = executor.submit(
+                    create_github,
+                    github_token,
+                    project_name,
+                    repo_privacy,
+                    description,
+                    github_org_name,
+                )
+                repo = make_and_init_git_repo(git_repo_dir)
+                repo_url = repo_url_future.result()
+
+            print("Pushing the local repo to Github")
+            push_git_repo(github_token, repo_url, repo, github_username)
 
             print("Setting branch protection rules")
             set_branch_protection_rules(github_token, project_name, github_org_name)
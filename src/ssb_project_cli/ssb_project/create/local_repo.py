@@ -88,11 +88,33 @@ def extract_name_email() -> tuple[str, str]:
         name: Value of user.name from git config element
         email: Value of user.email from git config element
     """
-    name = get_gitconfig_element("user.name")
-    email = get_gitconfig_element("user.email")
+    gitconfig = get_gitconfig()
+    name = gitconfig.get("user.name", "")
+    email = gitconfig.get("user.email", "")
     return name, email
 
 
+def get_gitconfig() -> dict[str, str]:
+    """Reads all properties from git config with a single git call.
+
+    Returns:
+        dict[str, str]: Git config element names mapped to their values.
+    """
+    cmd = ["git", "config", "--list", "--null"]
+    result = subprocess.run(  # noqa: S603 no untrusted input
+        cmd, stdout=subprocess.PIPE, encoding="utf-8"
+    )
+
+    # Entries are NUL terminated, with a newline between name and value.
+    # Later entries override earlier ones, same as `git config --get`.
+    gitconfig: dict[str, str] = {}
+    for entry in result.stdout.split("\0"):
+        if entry:
+            element, _, value = entry.partition("\n")
+            gitconfig[element] = value.strip()
+    return gitconfig
+
+
 def get_gitconfig_element(element: str) -> str:
     """Grabs a property from git config.
 
@@ -102,12 +124,7 @@ def get_gitconfig_element(element: str) -> str:
     Returns:
         str: Value of git config element
     """
-    cmd = ["git", "config", "--get", element]
-    result = subprocess.run(  # noqa: S603 no untrusted input
-        cmd, stdout=subprocess.PIPE, encoding="utf-8"
-    )
-
-    return result.stdout.strip()
+    return get_gitconfig().get(element, "")
 
 
 def make_and_init_git_repo(repo_dir: Path) -> Repo:
@@ -121,29 +138,30 @@ def make_and_init_git_repo(repo_dir: Path) -> Repo:
     Returns:
         Repo: Repository
     """
-    repo = Repo.init(repo_dir)
+    repo = Repo.init(repo_dir, initial_branch="main")
     repo.git.add("-A")
     repo.index.commit("Initial commit")
-    repo.git.branch("-M", "main")
     return repo
 
 
-def make_git_repo_and_push(github_token: str, github_url: str, repo_dir: Path) -> None:
-    """Makes and pushes a GitHub repository.
-
-    Inits a local repository and tries to push it to GitHub,
-     for more information see TempGitRemote.
+def push_git_repo(
+    github_token: str,
+    github_url: str,
+    repo: Repo,
+    github_username: str | None = None,
+) -> None:
+    """Pushes an initialized local repository to GitHub.
 
     Args:
         github_token: GitHub personal access token
         github_url: Repository url
-        repo_dir: Path to local Repository
+        repo: Local repository with an initial commit on main
+        github_username: GitHub username, looked up from the token if not given
     """
-    repo = make_and_init_git_repo(repo_dir)
-
-    github_username = get_github_username(
-        get_environment_specific_github_object(github_token), github_token
-    )
+    if not github_username:
+        github_username = get_github_username(
+            get_environment_specific_github_object(github_token), github_token
+        )
     credential_url = mangle_url(github_url, github_token)
     username_url = mangle_url(github_url, github_username)
 
@@ -22,20 +22,20 @@ def request_name_email() -> tuple[str, str]:
 def request_project_description() -> str:
     """Prompts the user for a project description.
 
-    Continues to prompt the user until a non-empty string is supplied.
+    Continues to prompt the user until a non-blank string is supplied.
 
     Returns:
          str: Project description
     """
-    description: str = typer.prompt("Project description")
+    description: str = typer.prompt("Project description").strip()
 
-    if description == "":
-        description = request_project_description()
+    while description == "":
+        description = typer.prompt("Project description").strip()
 
     return description
 
 
-def choose_login(path: Path) -> str:
+def choose_login(path: Path) -> tuple[str | None, str]:
     """Asks the user to pick between stored GitHub usernames.
 
     If GitHub credentials are not found users is promoted to input PAT.
@@ -44,19 +44,19 @@ def choose_login(path: Path) -> str:
         path: Path to folder containing GitHub credentials
 
     Returns:
-        str: GitHub personal access token
+        tuple[str | None, str]: GitHub username, if known from the stored credentials, and personal access token
     """
     user_token_dict: dict[str, str] = get_github_pat(path)
 
     if len(user_token_dict) == 1:
-        return list(user_token_dict.values())[0]
+        return next(iter(user_token_dict.items()))
     if user_token_dict:
         choice = questionary.select(
             "Select your GitHub account:", choices=user_token_dict.keys()  # type: ignore
         ).ask()
-        return user_token_dict[choice]
+        return choice, user_token_dict[choice]
     else:
         pat: str = questionary.password(
             "Enter your GitHub personal access token:"
         ).ask()
-        return pat
+        return None, pat
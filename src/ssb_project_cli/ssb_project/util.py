@@ -6,19 +6,30 @@ import os
 import subprocess  # noqa: S404
 import sys  # noqa: S404
 import time
+from collections import deque
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from typing import Union
 
 import jupyter_client
-import tomli
 from rich import print
 
 from .settings import HOME_PATH
 
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+
 kernelspec_manager = jupyter_client.kernelspec.KernelSpecManager()
 
+# Number of trailing output lines kept for the error log of a streamed command
+STREAMED_OUTPUT_TAIL_LINES = 200
+
 
 def set_debug_logging(home_path: Path = HOME_PATH) -> None:
     """Creates a file with log of error in the current folder.
@@ -28,8 +39,7 @@ def set_debug_logging(home_path: Path = HOME_PATH) -> None:
     """
     error_logs_path = f"{home_path}/ssb-project-cli/.error_logs/ssb-project-debug.log"
     log_dir = os.path.dirname(error_logs_path)
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     logging.basicConfig(filename=error_logs_path, level=logging.DEBUG)
 
 
@@ -45,8 +55,7 @@ def create_error_log(
     """
     try:
         error_logs_path = f"{home_path}/ssb-project-cli/.error_logs"
-        if not os.path.exists(error_logs_path):
-            os.makedirs(error_logs_path)
+        os.makedirs(error_logs_path, exist_ok=True)
         filename = f"{calling_function}-error-{int(time.time())}.txt"
         with open(f"{error_logs_path}/{filename}", "w+") as f:
             f.write(log)
@@ -104,18 +113,74 @@ def execute_command(
     return result
 
 
-def get_kernels_dict() -> dict[str, dict[str, str]]:
-    """Gets installed kernel specifications.
+def execute_command_streaming(
+    command: list[str],
+    command_shortname: str,
+    success_desc: Optional[str] = None,
+    failure_desc: Optional[str] = None,
+    cwd: Optional[Path] = None,
+    on_output: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Execute command while streaming its output, and handle failure/success cases.
+
+    Unlike `execute_command`, the output is not buffered in memory. Each line is
+    passed to `on_output` as it arrives, and only the last lines are kept for the
+    error log.
+
+    Args:
+        command: The command to be executed. For example ["poetry", "install"].
+        command_shortname: For example: "poetry-install". Used to create descriptive error log file.
+        success_desc: For example: "Poetry install ran successfully".
+        failure_desc: For example: "Something went wrong while running poetry install".
+        cwd: The current working directory.
+        on_output: Called with each line of combined stdout and stderr.
+    """
+    output_tail: deque[str] = deque(maxlen=STREAMED_OUTPUT_TAIL_LINES)
+    with subprocess.Popen(  # noqa S603
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        cwd=cwd,
+    ) as process:
+        if process.stdout is not None:
+            for line in process.stdout:
+                output_tail.append(line)
+                if on_output:
+                    on_output(line.rstrip())
+
+    if process.returncode != 0:
+        log = f"args={command}, returncode={process.returncode}, output:\n"
+        log += "".join(output_tail)
+        if failure_desc:
+            print(failure_desc)
+        else:
+            print("Error while running: " + " ".join(command))
+        create_error_log(log, command_shortname)
+        sys.exit(1)
+    elif success_desc:
+        print(success_desc)
+
+
+@lru_cache(maxsize=1)
+def get_kernels_dict() -> dict[str, str]:
+    """Gets installed kernels and their resource directories.
+
+    Only the kernel directories are listed, the kernel.json files are not parsed.
+    The result is cached, call `get_kernels_dict.cache_clear()` after
+    installing or removing a kernel.
 
     Returns:
-        kernel_dict: Dictionary of installed kernel specifications
+        kernel_dict: Dictionary of installed kernel names and their resource directory
     """
-    return kernelspec_manager.get_all_specs()
+    kernels: dict[str, str] = kernelspec_manager.find_kernel_specs()
+    return kernels
 
 
 def remove_kernel_spec(kernel_name: str) -> None:
     """Remove a kernel spec."""
     kernelspec_manager.remove_kernel_spec(kernel_name)
+    get_kernels_dict.cache_clear()
 
 
 def get_project_name_and_root_path(
@@ -144,8 +209,10 @@ def get_project_name_and_root_path(
     paths.extend(origin.parents)
 
     for path in paths:
-        if {i.name for i in path.iterdir()}.intersection(
-            {cruft_json_name, pyproject_name, ".git"}
+        # Check for the marker files directly instead of listing every directory
+        if any(
+            (path / marker).exists()
+            for marker in (cruft_json_name, pyproject_name, ".git")
         ):
             try:
                 # Attempt to source from Cruft first
@@ -159,9 +226,8 @@ def get_project_name_and_root_path(
             except (KeyError, FileNotFoundError, json.JSONDecodeError):
                 # Fall back to pyproject.toml
                 try:
-                    name = tomli.loads((path / pyproject_name).read_text())["tool"][
-                        "poetry"
-                    ]["name"]
+                    with (path / pyproject_name).open("rb") as f:
+                        name = tomllib.load(f)["tool"]["poetry"]["name"]
                     return (
                         name,
                         path,
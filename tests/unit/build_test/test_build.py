@@ -98,9 +98,7 @@ def test_ipykernel_attach_bashrc_success(
     mock_print: Mock,
     mock_get_kernels_dict: Mock,
 ) -> None:
-    mock_get_kernels_dict.return_value = {
-        "project_name": {"resource_dir": "/path/to/project/kernel"}
-    }
+    mock_get_kernels_dict.return_value = {"project_name": "/path/to/project/kernel"}
     project_name = "project_name"
 
     ipykernel_attach_bashrc(project_name)
@@ -139,7 +137,7 @@ def test_ipykernel_attach_bashrc_kernel_not_found(
 
 @patch(
     f"{BUILD}.get_kernels_dict",
-    return_value={"existing_project": {"resource_dir": "/path/which/does/not/exist"}},
+    return_value={"existing_project": "/path/which/does/not/exist"},
 )
 @patch(f"{BUILD}.Path.exists", side_effect=[False])
 @patch(f"{BUILD}.print")
@@ -161,7 +159,7 @@ def test_ipykernel_attach_bashrc_kernel_path_does_not_exist(
 
 @patch(
     f"{BUILD}.get_kernels_dict",
-    return_value={"existing_project": {"resource_dir": "/path/which/does/not/exist"}},
+    return_value={"existing_project": "/path/which/does/not/exist"},
 )
 @patch(f"{BUILD}.Path.exists", side_effect=[True, False])
 @patch(f"{BUILD}.print")
@@ -183,7 +181,7 @@ def test_ipykernel_attach_bashrc_kernel_json_file_not_exist(
 
 @patch(
     f"{BUILD}.get_kernels_dict",
-    return_value={"existing_project": {"resource_dir": "/path/which/does/not/exist"}},
+    return_value={"existing_project": "/path/which/does/not/exist"},
 )
 @patch(f"{BUILD}.Path.exists", side_effect=[True, True])
 @patch("builtins.open", new_callable=mock_open)
@@ -224,7 +222,7 @@ def test_ipykernel_attach_bashrc_python_executable_path_not_found(
 
 @patch(
     f"{BUILD}.get_kernels_dict",
-    return_value={"existing_project": {"resource_dir": "/path/which/does/not/exist"}},
+    return_value={"existing_project": "/path/which/does/not/exist"},
 )
 @patch(f"{BUILD}.Path.exists", side_effect=[True, True])
 @patch("builtins.open", new_callable=mock_open)
@@ -12,6 +12,7 @@ import pytest
 
 from ssb_project_cli.ssb_project.build.environment import NEXUS_SOURCE_NAME
 from ssb_project_cli.ssb_project.build.poetry import check_and_fix_onprem_source
+from ssb_project_cli.ssb_project.build.poetry import install_ipykernel
 from ssb_project_cli.ssb_project.build.poetry import poetry_install
 from ssb_project_cli.ssb_project.build.poetry import poetry_source_add
 from ssb_project_cli.ssb_project.build.poetry import poetry_source_includes_source_name
@@ -25,7 +26,7 @@ POETRY = "ssb_project_cli.ssb_project.build.poetry"
 CLEAN = "ssb_project_cli.ssb_project.clean.clean"
 
 
-@patch(f"{POETRY}.execute_command")
+@patch(f"{POETRY}.execute_command_streaming")
 def test_poetry_install(mock_run: Mock) -> None:
     project_dir = Path(__file__).parent  # Just some dummy dir, not used
     poetry_install(project_dir)
@@ -33,7 +34,23 @@ def test_poetry_install(mock_run: Mock) -> None:
     assert mock_run.call_args[0][0] == ["poetry", "install"]
 
 
-@patch(f"{POETRY}.execute_command")
+@patch(f"{POETRY}.execute_command_streaming")
+def test_install_ipykernel(mock_run: Mock, tmp_path: Path) -> None:
+    install_ipykernel(tmp_path, "test-project")
+    assert mock_run.call_args[0][0] == [
+        "poetry",
+        "run",
+        "python3",
+        "-m",
+        "ipykernel",
+        "install",
+        "--user",
+        "--name",
+        "test-project",
+    ]
+
+
+@patch(f"{POETRY}.execute_command_streaming")
 def test_poetry_update_lockfile_dependencies(mock_run: Mock) -> None:
     project_dir = Path(__file__).parent  # Just some dummy dir, not used
     poetry_update_lockfile_dependencies(project_dir)
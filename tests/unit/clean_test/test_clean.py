@@ -28,19 +28,38 @@ def test_clean(
     assert mock_clean_venv.call_count == 1
 
 
-@patch(f"{CLEAN}.execute_command")
+@patch(f"{CLEAN}.shutil.rmtree")
 @patch(f"{CLEAN}.Path.is_dir")
 @patch(f"{CLEAN}.questionary")
-def test_clean_venv(mock_confirm: Mock, mock_path: Mock, mock_execute: Mock) -> None:
-    """Check that execute command runs"""
+def test_clean_venv(mock_confirm: Mock, mock_is_dir: Mock, mock_rmtree: Mock) -> None:
+    """Check that the virtual environment is only removed when it exists"""
     mock_confirm.confirm().ask.return_value = True
-    mock_path.is_dir.return_value = True
+    mock_is_dir.return_value = True
 
     clean_venv()
 
-    mock_confirm.confirm().ask.return_value = True
-    mock_path.is_dir.return_value = False
+    mock_rmtree.assert_called_once_with(".venv")
+
+    mock_is_dir.return_value = False
 
     clean_venv()
 
-    assert mock_execute.call_count == 2
+    assert mock_rmtree.call_count == 1
+
+
+@patch(f"{CLEAN}.create_error_log")
+@patch(f"{CLEAN}.shutil.rmtree")
+@patch(f"{CLEAN}.Path.is_dir")
+@patch(f"{CLEAN}.questionary")
+def test_clean_venv_failure(
+    mock_confirm: Mock, mock_is_dir: Mock, mock_rmtree: Mock, mock_log: Mock
+) -> None:
+    """Check that a failed removal is logged and exits"""
+    mock_confirm.confirm().ask.return_value = True
+    mock_is_dir.return_value = True
+    mock_rmtree.side_effect = PermissionError
+
+    with pytest.raises(SystemExit):
+        clean_venv()
+
+    assert mock_log.call_count == 1
@@ -1,5 +1,6 @@
 """Tests for create function."""
 
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -7,6 +8,7 @@ from unittest.mock import patch
 import pytest
 
 from ssb_project_cli.ssb_project.app import create
+from ssb_project_cli.ssb_project.create.create import create_project
 from ssb_project_cli.ssb_project.create.create import is_valid_project_name
 from ssb_project_cli.ssb_project.create.repo_privacy import RepoPrivacy
 from ssb_project_cli.ssb_project.settings import STAT_TEMPLATE_DEFAULT_REFERENCE
@@ -189,6 +191,51 @@ class TestCreateFunction(TestCase):
         assert excinfo.value.code == expected_exit_code
 
 
+@patch(f"{CREATE}.is_memory_full")
+@patch(f"{CREATE}.is_github_repo", return_value=False)
+@patch(f"{CREATE}.create_project_from_template", return_value=None)
+@patch(f"{CREATE}.build_project", return_value=None)
+@patch(f"{CREATE}.create_github", return_value="https://github.com/org/repo.git")
+@patch(f"{CREATE}.make_and_init_git_repo")
+@patch(f"{CREATE}.push_git_repo")
+@patch(f"{CREATE}.set_branch_protection_rules")
+def test_create_with_github(
+    mock_protection: Mock,
+    mock_push: Mock,
+    mock_git: Mock,
+    mock_create_github: Mock,
+    _mock_build_project: Mock,
+    _mock_template: Mock,
+    _mock_is_github_repo: Mock,
+    _mock_is_memory_full: Mock,
+    tmp_path: Path,
+) -> None:
+    """Check that the local repo is pushed to the url of the created GitHub repo."""
+    create_project(
+        "test-project",
+        "description",
+        RepoPrivacy.internal,
+        True,
+        "github_token",
+        tmp_path,
+        tmp_path,
+        "org",
+        STAT_TEMPLATE_REPO_URL,
+        STAT_TEMPLATE_DEFAULT_REFERENCE,
+        None,
+        None,
+    )
+    assert mock_create_github.call_count == 1
+    assert mock_git.call_count == 1
+    mock_push.assert_called_once_with(
+        "github_token",
+        "https://github.com/org/repo.git",
+        mock_git.return_value,
+        None,
+    )
+    assert mock_protection.call_count == 1
+
+
 @patch(f"{CREATE}.Path.exists")
 def test_project_dir_exists(mock_path_exists: Mock) -> None:
     # Test that SystemExit is raised when the project directory exists
@@ -220,7 +267,7 @@ def test_is_valid_project_name() -> None:
     assert is_valid_project_name("123randomletteRs") == False  # noqa: E712
 
 
-@patch("ssb_project_cli.ssb_project.app.create_project", return_value=None)
+@patch(f"{CREATE}.create_project", return_value=None)
 def test_default_options_and_types(mock_create_project: Mock) -> None:
     """Check default options and types retuned by the create typer CLI command."""
     # Check when all optional parameters are given
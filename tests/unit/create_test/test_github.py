@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 import pytest
 from github import BadCredentialsException
-from github import GithubException
+from requests.adapters import HTTPAdapter
 
 from ssb_project_cli.ssb_project.create.github import create_github
 from ssb_project_cli.ssb_project.create.github import (
@@ -18,6 +18,7 @@ from ssb_project_cli.ssb_project.create.github import get_github_pat_from_gitcre
 from ssb_project_cli.ssb_project.create.github import get_github_pat_from_netrc
 from ssb_project_cli.ssb_project.create.github import get_github_username
 from ssb_project_cli.ssb_project.create.github import get_org_members
+from ssb_project_cli.ssb_project.create.github import get_requests_session
 from ssb_project_cli.ssb_project.create.github import is_github_repo
 from ssb_project_cli.ssb_project.create.github import set_branch_protection_rules
 
@@ -25,11 +26,26 @@ from ssb_project_cli.ssb_project.create.github import set_branch_protection_rule
 GITHUB = "ssb_project_cli.ssb_project.create.github"
 
 
+@pytest.fixture(autouse=True)
+def clear_github_object_cache() -> None:
+    """Make sure each test gets freshly created (mocked) GitHub clients."""
+    get_environment_specific_github_object.cache_clear()
+    get_requests_session.cache_clear()
+
+
 @patch(f"{GITHUB}.Github")
 def test_create_github(mock_github: Mock) -> None:
     """Checks if create_github works."""
-    create_github("token", "repo", "privacy", "desc", "org_name")
+    created_repo = mock_github.return_value.get_organization.return_value.create_repo
+    created_repo.return_value.clone_url = "https://github.com/org_name/repo.git"
+
+    assert (
+        create_github("token", "repo", "privacy", "desc", "org_name")
+        == "https://github.com/org_name/repo.git"
+    )
     assert mock_github.call_count == 1
+    created_repo.return_value.replace_topics.assert_called_once_with(["ssb-project"])
+    assert mock_github.return_value.get_repo.call_count == 0
 
 
 @patch(f"{GITHUB}.Github.get_organization")
@@ -48,15 +64,18 @@ def test_create_github_bad_credentials(
     assert mock_log.call_count == 1
 
 
-@patch(f"{GITHUB}.Github.get_repo")
-def test_is_github_repo(mock_get_repo: Mock) -> None:
+@patch(f"{GITHUB}.get_requests_session")
+def test_is_github_repo(mock_session: Mock) -> None:
     """Checks if is_github_repo returns/raises expected values/errors."""
-    mock_get_repo.side_effect = [
-        None,
-        GithubException(status=1, data="", headers=None),
+    mock_session.return_value.head.side_effect = [
+        Mock(status_code=200),
+        Mock(status_code=404),
+        Mock(status_code=401),
     ]
     assert is_github_repo("fake-token", "", "org_name")
     assert not is_github_repo("fake-token", "", "org_name")
+    with pytest.raises(SystemExit):
+        is_github_repo("fake-token", "", "org_name")
 
 
 @patch(f"{GITHUB}.Github")
@@ -68,6 +87,9 @@ def test_set_branch_protection_rules(mock_github: Mock) -> None:
     """
     set_branch_protection_rules("token", "repo", "org_name")
     assert "token" in mock_github.call_args[0][0]
+    mock_github.return_value.get_repo.assert_called_once_with(
+        "org_name/repo", lazy=True
+    )
 
 
 @pytest.mark.parametrize(
@@ -148,12 +170,22 @@ def test_get_environment_specific_github_object(
     )
 
     # Test when not running on-premises
+    get_environment_specific_github_object.cache_clear()
     get_environment_specific_github_object("")
 
     # Assert that the Github object was called with verify=True
     assert "verify" not in mock_github.call_args.kwargs.keys()
 
 
+def test_get_requests_session_retries() -> None:
+    adapter = get_requests_session().get_adapter("https://api.github.com")
+    assert isinstance(adapter, HTTPAdapter)
+    retry = adapter.max_retries
+    assert retry.total == 5
+    assert 429 in retry.status_forcelist
+    assert retry.respect_retry_after_header
+
+
 @patch(f"{GITHUB}.requests")
 def test_get_org_members(mock_requests: Mock) -> None:
     mock_response_1 = MagicMock()
@@ -168,8 +200,10 @@ def test_get_org_members(mock_requests: Mock) -> None:
     mock_response_3.status_code = 200
     mock_response_3.json.return_value = []
 
-    mock_requests.get.side_effect = [mock_response_1, mock_response_2, mock_response_3]
+    mock_session = mock_requests.Session.return_value
+    mock_session.get.side_effect = [mock_response_1, mock_response_2, mock_response_3]
     assert get_org_members("fake_token") == ["user1", "user2"]
+    assert mock_requests.Session.call_count == 1
 
 
 @patch(f"{GITHUB}.requests")
@@ -177,7 +211,7 @@ def test_get_org_members_cant_reach_api(mock_requests: Mock) -> None:
     mock_response = MagicMock()
     mock_response.status_code = 1
 
-    mock_requests.get.side_effect = mock_response
+    mock_requests.Session.return_value.get.return_value = mock_response
     with pytest.raises(SystemExit):
         get_org_members("fake_token")
 
@@ -11,8 +11,9 @@ from ssb_project_cli.ssb_project.create.github import valid_repo_name
 from ssb_project_cli.ssb_project.create.local_repo import create_project_from_template
 from ssb_project_cli.ssb_project.create.local_repo import extract_name_email
 from ssb_project_cli.ssb_project.create.local_repo import get_gitconfig_element
-from ssb_project_cli.ssb_project.create.local_repo import make_git_repo_and_push
+from ssb_project_cli.ssb_project.create.local_repo import make_and_init_git_repo
 from ssb_project_cli.ssb_project.create.local_repo import mangle_url
+from ssb_project_cli.ssb_project.create.local_repo import push_git_repo
 from ssb_project_cli.ssb_project.settings import STAT_TEMPLATE_DEFAULT_REFERENCE
 from ssb_project_cli.ssb_project.settings import STAT_TEMPLATE_REPO_URL
 
@@ -49,74 +50,84 @@ def test_mangle_url(url: str, mangle: str, expected: str) -> None:
     assert mangle_url(url, mangle) == expected
 
 
-@patch(f"{LOCAL_REPO}.temp_git_repo.Repo")
+def test_make_and_init_git_repo(tmp_path: Path) -> None:
+    """Checks that the repo is created on main with all files committed."""
+    (tmp_path / "README.md").write_text("# Test")
+
+    repo = make_and_init_git_repo(tmp_path)
+
+    assert repo.active_branch.name == "main"
+    assert repo.head.commit.message == "Initial commit"
+    assert "README.md" in repo.head.commit.tree
+    assert not repo.is_dirty(untracked_files=True)
+
+
 @patch(f"{LOCAL_REPO}.get_environment_specific_github_object")
-@patch(f"{LOCAL_REPO}.make_and_init_git_repo")
-def test_make_git_repo_and_push(
-    mock_make_and_init_git_repo: Mock,
-    mock_get_environment_specific_github_object: Mock,
-    mock_repo: Mock,
+@patch(f"{LOCAL_REPO}.get_github_username", return_value="user")
+def test_push_git_repo(
+    _mock_get_username: Mock,
+    _mock_get_environment_specific_github_object: Mock,
 ) -> None:
-    """Checks that make_git_repo_and_push works.
+    """Checks that push_git_repo works.
 
     The git repo is mocked with 5 fake remotes to check that
     repo.delete_remote is called the expected amount of times.
     """
-    mock_get_environment_specific_github_object.get_user.return_value = Mock(
-        login="user"
-    )
-
     test_repo = Mock(remotes=range(5))
-    mock_make_and_init_git_repo.return_value = test_repo
-    mock_repo.init.return_value = test_repo
 
-    make_git_repo_and_push("", "", Path())
+    push_git_repo("", "", test_repo)
 
-    assert mock_make_and_init_git_repo.call_count == 1
     assert test_repo.delete_remote.call_count == 6
     assert test_repo.create_remote.call_count == 2
     assert test_repo.git.push.call_count == 1
 
 
-@patch(f"{LOCAL_REPO}.temp_git_repo.Repo")
-@patch(f"{LOCAL_REPO}.get_environment_specific_github_object")
-@patch(f"{LOCAL_REPO}.make_and_init_git_repo")
-def test_make_and_repo_and_push(
-    mock_make_and_init_git_repo: Mock,
-    mock_get_environment_specific_github_object: Mock,
-    mock_repo: Mock,
+@patch(f"{LOCAL_REPO}.temp_git_repo.TempGitRemote")
+@patch(f"{LOCAL_REPO}.get_github_username")
+def test_push_git_repo_known_username(
+    mock_get_username: Mock, mock_remote: Mock
 ) -> None:
-    """Checks that make_git_repo_and_push works.
+    """Checks that a known username is used without looking it up."""
+    repo = Mock()
 
-    The git repo is mocked with 5 fake remotes to check that
-    repo.delete_remote is called the expected amount of times.
-    """
-    mock_get_environment_specific_github_object.get_user.return_value = Mock(
-        login="user"
+    push_git_repo("token", "https://github.com/org/repo.git", repo, "user")
+
+    assert mock_get_username.call_count == 0
+    mock_remote.assert_called_once_with(
+        repo,
+        "https://token@github.com/org/repo.git",
+        "https://user@github.com/org/repo.git",
     )
+    repo.git.push.assert_called_once_with("--set-upstream", "origin", "main")
 
-    test_repo = Mock(remotes=range(5))
-    mock_make_and_init_git_repo.return_value = test_repo
-    mock_repo.init.return_value = test_repo
 
-    make_git_repo_and_push("", "", Path())
+@patch(f"{LOCAL_REPO}.temp_git_repo.TempGitRemote")
+@patch(f"{LOCAL_REPO}.get_environment_specific_github_object")
+@patch(f"{LOCAL_REPO}.get_github_username", return_value="user")
+def test_push_git_repo_looks_up_username(
+    mock_get_username: Mock,
+    mock_get_environment_specific_github_object: Mock,
+    mock_remote: Mock,
+) -> None:
+    """Checks that the username is looked up from the token when not given."""
+    repo = Mock()
 
-    assert mock_make_and_init_git_repo.call_count == 1
-    assert test_repo.delete_remote.call_count == 6
-    assert test_repo.create_remote.call_count == 2
-    assert test_repo.git.push.call_count == 1
+    push_git_repo("token", "https://github.com/org/repo.git", repo)
+
+    mock_get_username.assert_called_once_with(
+        mock_get_environment_specific_github_object.return_value, "token"
+    )
+    mock_remote.assert_called_once_with(
+        repo,
+        "https://token@github.com/org/repo.git",
+        "https://user@github.com/org/repo.git",
+    )
+    repo.git.push.assert_called_once_with("--set-upstream", "origin", "main")
 
 
 def fake_run_gitconfig(cmd: list[str], stdout: int, encoding: str) -> Mock:
-    """Emulates subprocess.run for git config --get."""
-    vals = {
-        "user.name": "Name",
-        "user.email": "name@email.com",
-    }
-    key = cmd[-1]
-    if key not in vals:
-        return Mock(stdout="")
-    return Mock(stdout=vals[key])
+    """Emulates subprocess.run for git config --list --null."""
+    return Mock(stdout="user.name\nName\0user.email\nname@email.com\0")
 
 
 @patch(f"{LOCAL_REPO}.subprocess.run", fake_run_gitconfig)
@@ -131,10 +142,15 @@ def test_get_gitconfig_element() -> None:
 def test_extract_name_email(mock_run: Mock) -> None:
     """Checks if extract_name_email returns the expected values."""
     mock_run.side_effect = [
-        Mock(stdout=s) for s in ["Name ", " name@email.com", "Name2", ""]
+        Mock(stdout=s)
+        for s in [
+            "user.name\nName \0user.email\n name@email.com\0",
+            "user.name\nOld\0core.bare\0user.name\nName2\0",
+        ]
     ]
     assert extract_name_email() == ("Name", "name@email.com")
     assert extract_name_email() == ("Name2", "")
+    assert mock_run.call_count == 2
 
 
 @patch(f"{LOCAL_REPO}.check_and_fix_onprem_source")
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 from ssb_project_cli.ssb_project.create.prompt import choose_login
 from ssb_project_cli.ssb_project.create.prompt import request_name_email
+from ssb_project_cli.ssb_project.create.prompt import request_project_description
 
 
 PROMPT = "ssb_project_cli.ssb_project.create.prompt"
@@ -18,15 +19,23 @@ def test_request_name_email(mock_prompt: Mock) -> None:
     assert request_name_email() == ("Name", "email@email.com")
 
 
+@patch(f"{PROMPT}.typer.prompt")
+def test_request_project_description(mock_prompt: Mock) -> None:
+    """Checks that empty descriptions are asked for again."""
+    mock_prompt.side_effect = ["", "  ", " A description "]
+    assert request_project_description() == "A description"
+    assert mock_prompt.call_count == 3
+
+
 @patch(f"{PROMPT}.get_github_pat")
 @patch(f"{PROMPT}.questionary")
 def test_prompt_pat(mock_questionary: Mock, mock_get_pat: Mock) -> None:
     mock_get_pat.return_value = {"user": "pat", "user2": "pat2"}
     mock_questionary.select().ask.return_value = "user2"
-    assert choose_login(Path(".")) == "pat2"
+    assert choose_login(Path(".")) == ("user2", "pat2")
 
 
 @patch(f"{PROMPT}.get_github_pat")
 def test_prompt_pat_single_login(mock_get_pat: Mock) -> None:
     mock_get_pat.return_value = {"user": "pat"}
-    assert choose_login(Path(".")) == "pat"
+    assert choose_login(Path(".")) == ("user", "pat")
@@ -1,6 +1,7 @@
 """Tests utils functions."""
 
 import json
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock
@@ -10,7 +11,10 @@ import pytest
 import tomli_w
 
 from ssb_project_cli.ssb_project.util import execute_command
+from ssb_project_cli.ssb_project.util import execute_command_streaming
+from ssb_project_cli.ssb_project.util import get_kernels_dict
 from ssb_project_cli.ssb_project.util import get_project_name_and_root_path
+from ssb_project_cli.ssb_project.util import remove_kernel_spec
 from ssb_project_cli.ssb_project.util import set_debug_logging
 
 
@@ -51,6 +55,32 @@ def test_execute_command_success(mock_run: Mock, mock_print: Mock) -> None:
     mock_print.assert_called_with("Success")
 
 
+@patch(f"{UTILS}.print")
+def test_execute_command_streaming(mock_print: Mock) -> None:
+    """Tests that output lines are passed on as they arrive."""
+    lines: list[str] = []
+    execute_command_streaming(
+        [sys.executable, "-c", "print('first'); print('second')"],
+        "cmd-test",
+        "Success",
+        on_output=lines.append,
+    )
+    assert lines == ["first", "second"]
+    mock_print.assert_called_with("Success")
+
+
+@patch(f"{UTILS}.create_error_log")
+def test_execute_command_streaming_failure(mock_create_log: Mock) -> None:
+    """Tests that a failing command logs its output and exits."""
+    with pytest.raises(SystemExit):
+        execute_command_streaming(
+            [sys.executable, "-c", "import sys; print('boom'); sys.exit(3)"],
+            "cmd-test",
+        )
+    assert mock_create_log.call_count == 1
+    assert "boom" in mock_create_log.call_args[0][0]
+
+
 def test_set_debug_logging_folders_created() -> None:
     with tempfile.TemporaryDirectory() as tempdir:
         error_logs_path = Path(f"{tempdir}/ssb-project-cli/.error_logs/")
@@ -103,3 +133,17 @@ def test_get_project_name_non_existing_path(tmp_path: Path) -> None:
 
 def test_get_project_name_non_project_dir(tmp_path: Path) -> None:
     assert get_project_name_and_root_path(tmp_path) == (None, None)
+
+
+@patch(f"{UTILS}.kernelspec_manager")
+def test_get_kernels_dict_cached_until_kernel_removed(mock_manager: Mock) -> None:
+    get_kernels_dict.cache_clear()
+    mock_manager.find_kernel_specs.return_value = {"project": "path"}
+
+    assert get_kernels_dict() == {"project": "path"}
+    get_kernels_dict()
+    assert mock_manager.find_kernel_specs.call_count == 1
+
+    remove_kernel_spec("project")
+    get_kernels_dict()
+    assert mock_manager.find_kernel_specs.call_count == 2